@@ -2,15 +2,51 @@
 """Gather open GitHub issues via gh CLI."""
 
 import argparse
+import functools
 import json
 import subprocess
 import sys
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
 
+# orjson is optional but much faster on large issue dumps; fall back to
+# stdlib json so the skill stays dependency-free.
+try:
+    import orjson
+
+    def _json_dumps(data: object) -> bytes:
+        return orjson.dumps(data)
+
+    def _json_dumps_pretty(data: object) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    def _json_loads(data: bytes | str) -> object:
+        return orjson.loads(data)
+
+except ImportError:
+
+    def _json_dumps(data: object) -> bytes:
+        return json.dumps(data).encode()
+
+    def _json_dumps_pretty(data: object) -> bytes:
+        return json.dumps(data, indent=2).encode()
+
+    def _json_loads(data: bytes | str) -> object:
+        return json.loads(data)
+
+
+
+@functools.lru_cache(maxsize=1)
 def detect_repo() -> str:
-    """Detect OWNER/REPO from git remote origin."""
+    """Detect OWNER/REPO from git remote origin.
+
+    Memoized: the remote cannot change within one process, so repeat
+    callers get a dict lookup instead of a git spawn.
+    """
     result = subprocess.run(
         ["git", "remote", "get-url", "origin"],
         capture_output=True, text=True, check=True,
@@ -41,50 +77,207 @@ def gather_from_gh(
     if label:
         cmd.extend(["--label", label])
     result = subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=60)
-    return json.loads(result.stdout)
+    return _json_loads(result.stdout)
+
+
+def _fetch_issue_page(
+    repo: str, page: int, per_page: int, label: str | None
+) -> list[dict]:
+    """Fetch one REST page of open issues via gh api."""
+    path = f"repos/{repo}/issues?state=open&per_page={per_page}&page={page}"
+    if label:
+        path += f"&labels={urllib.parse.quote(label)}"
+    result = subprocess.run(
+        ["gh", "api", path],
+        capture_output=True, text=True, check=True, timeout=60,
+    )
+    return _json_loads(result.stdout)
+
+
+def _rest_to_cli(raw: dict) -> dict:
+    """Adapt a REST issue object to the gh CLI shape transform_issues eats.
+
+    The REST list endpoint reports comments as a count rather than a
+    list, so comments_count survives but last_comment_at does not.
+    """
+    return {
+        "number": raw["number"],
+        "title": raw.get("title", ""),
+        "body": raw.get("body") or "",
+        "labels": raw.get("labels") or [],
+        "createdAt": raw.get("created_at", ""),
+        "updatedAt": raw.get("updated_at", ""),
+        "author": {"login": (raw.get("user") or {}).get("login", "unknown")},
+        "comments": raw.get("comments", 0),
+        "url": raw.get("html_url", ""),
+    }
+
+
+def gather_from_gh_parallel(
+    repo: str, limit: int, label: str | None = None, jobs: int = 4
+) -> list[dict]:
+    """Fetch open issues with several REST page fetches in flight.
+
+    'gh issue list' walks pages sequentially; fetching pages concurrently
+    overlaps the network latency. The REST issues endpoint mixes in pull
+    requests, so those are filtered out.
+    """
+    per_page = 100
+    raw_issues: list[dict] = []
+    page = 1
+    with ThreadPoolExecutor(max_workers=jobs) as ex:
+        while True:
+            pages = range(page, page + jobs)
+            results = list(ex.map(
+                lambda p: _fetch_issue_page(repo, p, per_page, label), pages
+            ))
+            for result in results:
+                raw_issues.extend(
+                    _rest_to_cli(r) for r in result if "pull_request" not in r
+                )
+            if any(len(result) < per_page for result in results):
+                break
+            if limit and len(raw_issues) >= limit:
+                break
+            page += jobs
+    if limit:
+        raw_issues = raw_issues[:limit]
+    return raw_issues
 
 
 def compute_last_comment_at(comments: list[dict]) -> str | None:
     """Extract the timestamp of the most recent comment."""
+    # Most issues have zero or one comment; answer those without
+    # building the generator/max machinery at all.
     if not comments:
         return None
-    dates = [c.get("createdAt", "") for c in comments if c.get("createdAt")]
-    if not dates:
-        return None
-    return max(dates)
+    if len(comments) == 1:
+        return comments[0].get("createdAt") or None
+    # ISO timestamps sort lexicographically, so a single max() pass over a
+    # generator suffices — no intermediate list of dates. gh does not
+    # guarantee comment order, so the last element cannot be trusted.
+    return max(
+        (c["createdAt"] for c in comments if c.get("createdAt")),
+        default=None,
+    )
+
+
+@dataclass(slots=True)
+class Issue:
+    """One issue in our schema.
+
+    A slotted struct stores the fields by offset instead of paying
+    a hash-table insert per key per issue, which adds up over the
+    hundreds of rows a full gather produces.
+    """
 
+    number: int
+    title: str
+    body: str
+    labels: list[str]
+    state: str
+    created_at: str
+    updated_at: str
+    last_comment_at: str | None
+    author: str
+    comments_count: int
+    url: str
 
-def transform_issues(raw_issues: list[dict]) -> list[dict]:
+    def to_dict(self) -> dict:
+        """Plain-dict view for JSON serialization."""
+        return {
+            "number": self.number,
+            "title": self.title,
+            "body": self.body,
+            "labels": self.labels,
+            "state": self.state,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "last_comment_at": self.last_comment_at,
+            "author": self.author,
+            "comments_count": self.comments_count,
+            "url": self.url,
+        }
+
+
+def _transform_one(raw: dict) -> Issue:
+    """Transform a single gh CLI issue object to our schema."""
+    # Bind the method once; each raw.get in the constructor call below
+    # would otherwise be a fresh attribute lookup, times N issues.
+    get = raw.get
+    comments = get("comments") or ()
+    if isinstance(comments, int):
+        # REST shape: a bare count, no comment objects
+        comments_count, last_comment_at = comments, None
+    else:
+        comments_count = len(comments)
+        last_comment_at = compute_last_comment_at(comments)
+    return Issue(
+        number=raw["number"],
+        title=raw["title"],
+        body=get("body", ""),
+        labels=[label["name"] for label in get("labels") or ()],
+        state="OPEN",
+        created_at=get("createdAt", ""),
+        updated_at=get("updatedAt", ""),
+        last_comment_at=last_comment_at,
+        author=(get("author") or {}).get("login", "unknown"),
+        comments_count=comments_count,
+        url=get("url", ""),
+    )
+
+
+def transform_issues(raw_issues: list[dict]) -> list[Issue]:
     """Transform gh CLI output to our schema."""
-    issues = []
-    for raw in raw_issues:
-        last_comment = compute_last_comment_at(raw.get("comments", []))
-        issues.append({
-            "number": raw["number"],
-            "title": raw["title"],
-            "body": raw.get("body", ""),
-            "labels": [label["name"] for label in raw.get("labels", [])],
-            "state": "OPEN",
-            "created_at": raw.get("createdAt", ""),
-            "updated_at": raw.get("updatedAt", ""),
-            "last_comment_at": last_comment,
-            "author": raw.get("author", {}).get("login", "unknown"),
-            "comments_count": len(raw.get("comments", [])),
-            "url": raw.get("url", ""),
-        })
-    return issues
+    return [_transform_one(raw) for raw in raw_issues]
+
+
+def write_issues_json(output: Path, meta: dict, issues) -> int:
+    """Write the issues document incrementally, one issue at a time.
+
+    Serializing the whole document in one buffer costs peak memory of
+    roughly the payload size on top of the parsed issues; streaming the
+    array keeps the serializer's working set at a single issue. Returns
+    the number of issues written.
+    """
+    count = 0
+    with open(output, "wb") as f:
+        head = _json_dumps(meta)
+        f.write(head[:-1])  # re-open the meta object to append "issues"
+        f.write(b',"issues":[')
+        for issue in issues:
+            if count:
+                f.write(b",")
+            f.write(_json_dumps(issue))
+            count += 1
+        f.write(b"]}")
+    return count
+
+
+_head_sha: str | None = None
 
 
 def get_head_sha() -> str:
-    """Get HEAD commit SHA for building GitHub permalink URLs."""
+    """Get HEAD commit SHA for building GitHub permalink URLs.
+
+    The SHA is memoized for the process lifetime; failures yield ""
+    without caching it, so a later call can still succeed (e.g. once
+    inside a work tree).
+    """
+    global _head_sha
+    if _head_sha is not None:
+        return _head_sha
     try:
         result = subprocess.run(
             ["git", "rev-parse", "HEAD"],
             capture_output=True, text=True, check=True,
         )
-        return result.stdout.strip()
     except subprocess.CalledProcessError:
         return ""
+    sha = result.stdout.strip()
+    if sha:
+        _head_sha = sha
+    return sha
 
 
 def main() -> None:
@@ -96,10 +289,19 @@ def main() -> None:
         "--limit", type=int, default=0, help="Max issues to fetch (0 = all, default: all)"
     )
     parser.add_argument("--label", help="Filter by label")
+    parser.add_argument(
+        "--jobs", type=int, default=1,
+        help="Concurrent page fetches; >1 uses the REST API, which omits "
+             "last_comment_at (default: 1)",
+    )
     parser.add_argument(
         "--output", type=Path, default=None,
         help="Output path (default: .git/triage/issues.json)",
     )
+    parser.add_argument(
+        "--pretty", action="store_true",
+        help="Indent the output for human inspection (slower, larger)",
+    )
     args = parser.parse_args()
 
     repo = args.repo or detect_repo()
@@ -107,19 +309,31 @@ def main() -> None:
     output.parent.mkdir(parents=True, exist_ok=True)
 
     print(f"Gathering issues from {repo} (limit: {args.limit})...")
-    raw_issues = gather_from_gh(repo, args.limit, args.label)
-    issues = transform_issues(raw_issues)
+    if args.jobs > 1:
+        raw_issues = gather_from_gh_parallel(
+            repo, args.limit, args.label, jobs=args.jobs
+        )
+    else:
+        raw_issues = gather_from_gh(repo, args.limit, args.label)
 
-    data = {
+    meta = {
         "repo": repo,
         "fetched_at": datetime.now(timezone.utc).isoformat(),
         "source": "gh",
         "head_sha": get_head_sha(),
-        "issues": issues,
     }
-
-    output.write_text(json.dumps(data, indent=2))
-    print(f"Wrote {len(issues)} issues to {output}")
+    issues = transform_issues(raw_issues)
+    if args.pretty:
+        # Human-inspected path: one indented document, bytes straight out.
+        output.write_bytes(_json_dumps_pretty(
+            {**meta, "issues": [i.to_dict() for i in issues]}
+        ))
+        count = len(issues)
+    else:
+        # Machine consumers (the server) read this; compact output keeps
+        # the serializer's inner loop hot and halves the file size.
+        count = write_issues_json(output, meta, (i.to_dict() for i in issues))
+    print(f"Wrote {count} issues to {output}")
 
 
 if __name__ == "__main__":
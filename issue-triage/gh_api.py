@@ -0,0 +1,135 @@
+"""Minimal GitHub API client over a persistent HTTPS connection.
+
+Replaces per-call ``gh`` subprocesses (each paying a fork + TLS handshake
+against api.github.com) with requests on a single keep-alive connection.
+Uses only Python stdlib (http.client). The server falls back to the gh
+CLI when no token is available, so this module is optional at runtime.
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+import os
+import subprocess
+import threading
+
+
+class GhApiError(Exception):
+    """A GitHub API call failed."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"GitHub API error {status}: {message}")
+        self.status = status
+        self.message = message
+
+
+def get_token() -> str:
+    """Return an OAuth token from the environment or ``gh auth token``.
+
+    Returns an empty string when no token can be found (e.g. gh is not
+    installed or not logged in) — callers should fall back to the CLI.
+    """
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if token:
+        return token
+    try:
+        result = subprocess.run(
+            ["gh", "auth", "token"],
+            capture_output=True, text=True, check=True, timeout=10,
+        )
+        return result.stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+class GhApiClient:
+    """GitHub REST/GraphQL client reusing one keep-alive connection.
+
+    Thread-safe: requests are serialized with a lock, which is plenty for
+    this server's concurrency. A stale keep-alive connection is rebuilt
+    transparently and the request retried once.
+    """
+
+    HOST = "api.github.com"
+
+    def __init__(self, token: str):
+        self._token = token
+        self._lock = threading.Lock()
+        self._conn: http.client.HTTPSConnection | None = None
+
+    # -- Low-level ----------------------------------------------------------
+
+    def _do_request(
+        self, method: str, path: str, payload: bytes | None
+    ) -> tuple[int, bytes]:
+        headers = {
+            "Authorization": f"Bearer {self._token}",
+            "Accept": "application/vnd.github+json",
+            "User-Agent": "issue-triage",
+        }
+        if payload is not None:
+            headers["Content-Type"] = "application/json"
+        if self._conn is None:
+            self._conn = http.client.HTTPSConnection(self.HOST, timeout=30)
+        self._conn.request(method, path, body=payload, headers=headers)
+        resp = self._conn.getresponse()
+        return resp.status, resp.read()
+
+    def request(self, method: str, path: str, body: dict | None = None) -> object:
+        """Issue a REST request, returning the parsed JSON response.
+
+        Raises GhApiError on HTTP >= 400.
+        """
+        payload = json.dumps(body).encode() if body is not None else None
+        with self._lock:
+            try:
+                status, data = self._do_request(method, path, payload)
+            except (http.client.HTTPException, OSError):
+                # Keep-alive connection went stale: rebuild and retry once.
+                self.close(_locked=True)
+                status, data = self._do_request(method, path, payload)
+        parsed: object = None
+        if data:
+            try:
+                parsed = json.loads(data)
+            except json.JSONDecodeError:
+                parsed = None
+        if status >= 400:
+            message = ""
+            if isinstance(parsed, dict):
+                message = parsed.get("message", "")
+            raise GhApiError(status, message or data.decode(errors="replace"))
+        return parsed
+
+    # -- Convenience --------------------------------------------------------
+
+    def graphql(self, query: str, variables: dict | None = None) -> dict:
+        """Issue a GraphQL query, returning the ``data`` payload."""
+        result = self.request(
+            "POST", "/graphql", {"query": query, "variables": variables or {}}
+        )
+        if isinstance(result, dict) and result.get("errors"):
+            raise GhApiError(200, str(result["errors"]))
+        return result.get("data", {}) if isinstance(result, dict) else {}
+
+    def close(self, _locked: bool = False) -> None:
+        """Close the connection; safe to call from any thread.
+
+        *_locked* is for internal callers that already hold ``_lock``
+        (the stale-connection retry in ``request``); everyone else gets
+        the lock taken here so a close cannot race an in-flight request.
+        """
+        if _locked:
+            self._close_conn()
+        else:
+            with self._lock:
+                self._close_conn()
+
+    def _close_conn(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except OSError:
+                pass
+            self._conn = None
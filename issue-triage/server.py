@@ -8,43 +8,124 @@ Uses only Python stdlib (http.server, json, subprocess, etc.).
 from __future__ import annotations
 
 import argparse
+import copy
+import gzip
+import hashlib
 import http.server
 import json
-import mimetypes
 import os
+import re
+import shutil
 import signal
+import socket
 import subprocess
 import threading
 import sys
-import tempfile
-import urllib.parse
 from datetime import datetime, timezone
 from pathlib import Path
 
+import gh_api
+
 
 # ---------------------------------------------------------------------------
 # JSON helpers
 # ---------------------------------------------------------------------------
 
+# orjson is optional but markedly faster on multi-MB findings payloads;
+# fall back to stdlib json so the skill stays dependency-free.
+try:
+    import orjson
+
+    def _json_dumps(data: object) -> bytes:
+        return orjson.dumps(data)
+
+    def _json_dumps_pretty(data: object) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    def _json_loads(data: bytes | str) -> object:
+        return orjson.loads(data)
+
+except ImportError:
+
+    def _json_dumps(data: object) -> bytes:
+        return json.dumps(data).encode()
+
+    def _json_dumps_pretty(data: object) -> bytes:
+        return json.dumps(data, indent=2).encode()
+
+    def _json_loads(data: bytes | str) -> object:
+        return json.loads(data)
+
+
+# Parsed-JSON cache keyed by path. Entries are validated against
+# (st_mtime_ns, st_size, st_ino) so external edits are picked up.
+_json_cache: dict[Path, tuple[tuple[int, int, int], dict]] = {}
+_json_cache_lock = threading.Lock()
+
+
+def _stat_key(path: Path) -> tuple[int, int, int]:
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
 def load_json(path: Path) -> dict:
-    """Load a JSON file, returning empty dict if missing."""
-    if path.exists():
-        return json.loads(path.read_text())
-    return {}
+    """Load a JSON file, returning empty dict if missing.
+
+    Repeated loads of an unchanged file are served from an in-memory
+    cache instead of re-reading and re-parsing from disk. Every call
+    returns a private copy — handlers may mutate the result freely
+    without aliasing the cache (or each other) across threads.
+    """
+    try:
+        key = _stat_key(path)
+    except OSError:
+        return {}
+    with _json_cache_lock:
+        entry = _json_cache.get(path)
+        if entry is not None and entry[0] == key:
+            cached = entry[1]
+        else:
+            cached = None
+    if cached is None:
+        cached = _json_loads(path.read_bytes())
+        with _json_cache_lock:
+            _json_cache[path] = (key, cached)
+    return copy.deepcopy(cached)
 
 
 def save_json(path: Path, data: dict) -> None:
-    """Atomically write JSON to a file."""
+    """Atomically write JSON to a file.
+
+    One write plus one rename is the floor for a crash-safe update that
+    keeps the file readable by other tools at any instant; an append-only
+    journal would be cheaper per action but state.json is the documented
+    interface, so the atomic-replace contract stays.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_suffix(".tmp")
-    tmp.write_text(json.dumps(data, indent=2))
-    tmp.rename(path)
+    tmp.write_bytes(_json_dumps_pretty(data))
+    os.replace(tmp, path)
+    # Cache a private copy: the caller keeps mutating rights over *data*,
+    # and the cache must only ever hand out copies of a frozen snapshot.
+    snapshot = copy.deepcopy(data)
+    with _json_cache_lock:
+        try:
+            _json_cache[path] = (_stat_key(path), snapshot)
+        except OSError:
+            _json_cache.pop(path, None)
 
 
 # ---------------------------------------------------------------------------
 # State helpers
 # ---------------------------------------------------------------------------
 
+# Serializes triage-state updates: load_json hands each caller a private
+# copy, so the lock's job is to make the load-mutate-save cycle atomic
+# across handler threads — without it two concurrent actions could each
+# load the same snapshot and one update would be lost on save.
+_state_lock = threading.Lock()
+
+
 def mark_triaged(
     triage_dir: Path,
     number: int,
@@ -52,11 +133,13 @@ def mark_triaged(
     comment_posted: bool = False,
     note: str = "",
 ) -> dict:
-    """Record a triage decision in state.json and return the entry."""
+    """Record a triage decision in state.json and return the entry.
+
+    The write-through stays synchronous: state.json is the durable
+    record other tools read, and an action should not be acknowledged
+    before it is on disk.
+    """
     state_path = triage_dir / "state.json"
-    state = load_json(state_path)
-    if "triaged" not in state:
-        state["triaged"] = {}
     entry: dict = {
         "action": action,
         "at": datetime.now(timezone.utc).isoformat(),
@@ -65,8 +148,12 @@ def mark_triaged(
         entry["comment_posted"] = True
     if note:
         entry["note"] = note
-    state["triaged"][str(number)] = entry
-    save_json(state_path, state)
+    with _state_lock:
+        state = load_json(state_path)
+        if "triaged" not in state:
+            state["triaged"] = {}
+        state["triaged"][str(number)] = entry
+        save_json(state_path, state)
     return entry
 
 
@@ -74,107 +161,226 @@ def mark_triaged(
 # Request handler factory
 # ---------------------------------------------------------------------------
 
-def make_handler(triage_dir: Path, repo: str):
-    """Create a request handler class bound to *triage_dir* and *repo*."""
+# Content types for the handful of extensions the static bundle can hold.
+# A fixed table avoids dragging in mimetypes (which parses the system
+# mime.types database on first use) and lets us attach charsets so
+# browsers don't re-sniff.
+_EXT_CT = {
+    ".html": "text/html; charset=utf-8",
+    ".js": "application/javascript; charset=utf-8",
+    ".css": "text/css; charset=utf-8",
+    ".json": "application/json; charset=utf-8",
+    ".svg": "image/svg+xml",
+    ".png": "image/png",
+    ".ico": "image/x-icon",
+    ".woff2": "font/woff2",
+}
+
+
+def make_handler(triage_dir: Path, repo: str, api: gh_api.GhApiClient | None = None):
+    """Create a request handler class bound to *triage_dir* and *repo*.
+
+    When *api* is given, GitHub calls go over its persistent HTTPS
+    connection; otherwise each call shells out to the gh CLI.
+    """
 
     static_dir = Path(__file__).resolve().parent / "static"
 
+    # ThreadingHTTPServer gives each request its own thread, so one slow
+    # gh call (up to 30s) only blocks its own request — but a burst of
+    # them could fork an unbounded number of gh processes. Cap them.
+    gh_slots = threading.BoundedSemaphore(8)
+
+    # The static bundle is small and immutable for the server's lifetime:
+    # load every file once at startup so serving one is a dict lookup
+    # instead of per-request path resolution + stat + read. Unknown keys
+    # (including traversal attempts) simply miss the dict. Restart the
+    # server to pick up edited assets.
+    static_files: dict[str, tuple[bytes, str, str, bytes | None]] = {}
+    for _p in static_dir.rglob("*"):
+        if _p.is_file():
+            _data = _p.read_bytes()
+            _ct = _EXT_CT.get(_p.suffix.lower(), "application/octet-stream")
+            _etag = f'"{hashlib.blake2b(_data, digest_size=8).hexdigest()}"'
+            # Assets are immutable for the process lifetime, so pay for
+            # maximum compression once here; keep the variant only if it
+            # actually shrinks the payload.
+            _gz = gzip.compress(_data, compresslevel=9)
+            if len(_gz) >= len(_data):
+                _gz = None
+            static_files[str(_p.relative_to(static_dir))] = (_data, _ct, _etag, _gz)
+
     class Handler(http.server.BaseHTTPRequestHandler):
 
+        # Keep-alive: the UI polls /api/* frequently, and every response
+        # here carries an accurate Content-Length, so HTTP/1.1 lets each
+        # client reuse one TCP connection instead of re-handshaking.
+        protocol_version = "HTTP/1.1"
+
+        # Buffer the response stream: the stdlib default is unbuffered, so
+        # every send_header call becomes its own socket write.
+        wbufsize = 65536
+
+        # With keep-alive each connection pins a handler thread between
+        # requests, and BoundedThreadingHTTPServer caps those threads. A
+        # read timeout reaps idle connections (handle_one_request treats
+        # the timeout as close_connection), so abandoned tabs give their
+        # slot back instead of holding it forever.
+        timeout = 60
+
+        def setup(self):
+            super().setup()
+            # Responses go out in one write; don't let Nagle hold them
+            # back waiting for more data that will never come.
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
         def log_message(self, format, *args):  # noqa: A002
             """Suppress default access log noise."""
             pass
 
         # -- Response helpers -------------------------------------------------
 
+        def _send_raw(
+            self, status: int, headers: list[tuple[str, str]], body: bytes = b""
+        ) -> None:
+            """Emit a whole response (status line, headers, body) in one write.
+
+            send_response + N send_header calls each format and write
+            separately; building the response in one buffer lets TCP send
+            it as a single segment for small payloads.
+            """
+            reason = self.responses.get(status, ("", ""))[0]
+            parts = [f"{self.protocol_version} {status} {reason}\r\n"]
+            parts.extend(f"{name}: {value}\r\n" for name, value in headers)
+            parts.append("\r\n")
+            self.wfile.write("".join(parts).encode("latin-1") + body)
+
         def _send_json(self, data: object, status: int = 200) -> None:
-            body = json.dumps(data).encode()
-            self.send_response(status)
-            self.send_header("Content-Type", "application/json; charset=utf-8")
-            self.send_header("Content-Length", str(len(body)))
-            self.end_headers()
-            self.wfile.write(body)
+            self._send_json_bytes(_json_dumps(data), status)
+
+        def _accepts_gzip(self) -> bool:
+            return "gzip" in self.headers.get("Accept-Encoding", "")
+
+        def _send_json_bytes(self, body: bytes, status: int = 200) -> None:
+            headers = [("Content-Type", "application/json; charset=utf-8")]
+            if len(body) >= 1024 and self._accepts_gzip():
+                # Level 1 is the right trade for once-per-request dynamic
+                # payloads; JSON typically still shrinks 5-10x.
+                body = gzip.compress(body, compresslevel=1)
+                headers.append(("Content-Encoding", "gzip"))
+            headers.append(("Content-Length", str(len(body))))
+            self._send_raw(status, headers, body)
 
         def _send_error_json(self, status: int, message: str) -> None:
             self._send_json({"error": message}, status)
 
         def _serve_static(self, file_path: str) -> None:
-            """Serve a file from the static directory."""
-            # Normalize and prevent directory traversal
+            """Serve a file from the preloaded static bundle."""
             safe_path = os.path.normpath(file_path).lstrip("/")
-            full_path = static_dir / safe_path
-
-            # Ensure the resolved path is still inside static_dir
-            try:
-                full_path.resolve().relative_to(static_dir.resolve())
-            except ValueError:
-                self._send_error_json(403, "Forbidden")
-                return
-
-            if not full_path.is_file():
+            entry = static_files.get(safe_path)
+            if entry is None:
                 self._send_error_json(404, "Not found")
                 return
 
-            content_type, _ = mimetypes.guess_type(str(full_path))
-            if content_type is None:
-                content_type = "application/octet-stream"
-
-            data = full_path.read_bytes()
-            self.send_response(200)
-            self.send_header("Content-Type", content_type)
-            self.send_header("Content-Length", str(len(data)))
-            self.end_headers()
-            self.wfile.write(data)
+            data, content_type, etag, gz = entry
+            if self.headers.get("If-None-Match") == etag:
+                self._send_raw(304, [("ETag", etag)])
+                return
+            headers = [("Content-Type", content_type)]
+            if gz is not None and self._accepts_gzip():
+                data = gz
+                headers.append(("Content-Encoding", "gzip"))
+            headers.extend([
+                ("Content-Length", str(len(data))),
+                ("ETag", etag),
+                ("Vary", "Accept-Encoding"),
+            ])
+            self._send_raw(200, headers, data)
 
         def _read_body(self) -> bytes:
             length = int(self.headers.get("Content-Length", 0))
             return self.rfile.read(length)
 
-        def _parse_route(self) -> tuple[str, dict]:
-            parsed = urllib.parse.urlparse(self.path)
-            params = urllib.parse.parse_qs(parsed.query, keep_blank_values=True)
-            flat = {k: v[0] if len(v) == 1 else v for k, v in params.items()}
-            return parsed.path, flat
+        _ISSUE_RE = re.compile(r"^/api/issues/(\d+)$")
 
         # -- GET routes -------------------------------------------------------
 
         def do_GET(self):  # noqa: N802
-            path, params = self._parse_route()
-
-            if path == "/":
-                # Serve index.html
-                self._serve_static("index.html")
-            elif path == "/api/findings":
-                self._handle_get_findings()
-            elif path == "/api/state":
-                self._handle_get_state()
+            # No handler uses query parameters, so a plain partition on
+            # "?" replaces the urlparse + parse_qs round on every request.
+            path = self.path.partition("?")[0]
+
+            handler = self._GET_ROUTES.get(path)
+            if handler is not None:
+                handler(self)
             elif path.startswith("/api/issues/"):
-                try:
-                    number = int(path.split("/")[3])
-                    self._handle_get_issue(number)
-                except (ValueError, IndexError):
+                match = self._ISSUE_RE.match(path)
+                if match:
+                    self._handle_get_issue(int(match.group(1)))
+                else:
                     self._send_error_json(400, "Invalid issue number")
-            elif path.startswith("/"):
+            else:
                 # Try to serve as static file
                 self._serve_static(path.lstrip("/"))
-            else:
-                self._send_error_json(404, "Not found")
 
         # -- POST routes ------------------------------------------------------
 
         def do_POST(self):  # noqa: N802
-            path, _ = self._parse_route()
+            path = self.path.partition("?")[0]
 
-            if path == "/api/action":
-                self._handle_action()
+            handler = self._POST_ROUTES.get(path)
+            if handler is not None:
+                handler(self)
             else:
+                # Drain the request body first: with keep-alive, leaving it
+                # unread would desync the connection — the next request line
+                # would be parsed out of the leftover body bytes.
+                self._read_body()
                 self._send_error_json(404, "Not found")
 
         # -- API handlers -----------------------------------------------------
 
         def _handle_get_findings(self) -> None:
-            data = load_json(triage_dir / "findings.json")
-            self._send_json(data)
+            # The on-disk file is already the exact response body, so
+            # stream it straight to the socket instead of parsing and
+            # re-serializing a potentially multi-MB payload.
+            self._stream_file(triage_dir / "findings.json", missing_body=b"{}")
+
+        def _stream_file(
+            self,
+            path: Path,
+            content_type: str = "application/json; charset=utf-8",
+            missing_body: bytes | None = None,
+        ) -> None:
+            """Stream a file to the client with ETag/304 handling."""
+            try:
+                f = open(path, "rb")
+            except OSError:
+                if missing_body is not None:
+                    self._send_json_bytes(missing_body)
+                else:
+                    self._send_error_json(404, "Not found")
+                return
+            with f:
+                # fstat the opened descriptor: a stat taken before the
+                # open could describe a file the analyzer has atomically
+                # replaced in the window, and a Content-Length that does
+                # not match the streamed body desyncs the keep-alive
+                # connection. The opened inode is immutable (writers use
+                # write-then-rename), so these numbers stay true.
+                st = os.fstat(f.fileno())
+                etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self._send_raw(304, [("ETag", etag)])
+                    return
+                self._send_raw(200, [
+                    ("Content-Type", content_type),
+                    ("Content-Length", str(st.st_size)),
+                    ("ETag", etag),
+                ])
+                # 64KB chunks keep the TCP window full without buffering
+                # the whole file in memory.
+                shutil.copyfileobj(f, self.wfile, length=65536)
 
         def _handle_get_state(self) -> None:
             data = load_json(triage_dir / "state.json")
@@ -183,17 +389,62 @@ def make_handler(triage_dir: Path, repo: str):
             self._send_json(data)
 
         def _handle_get_issue(self, number: int) -> None:
-            """Fetch full issue details via gh CLI."""
-            try:
-                result = subprocess.run(
-                    [
-                        "gh", "issue", "view", str(number),
-                        "--repo", repo,
-                        "--json", "number,title,body,comments,labels,state",
+            """Fetch full issue details via the API client or gh CLI."""
+            if api is not None:
+                try:
+                    issue = api.request(
+                        "GET", f"/repos/{repo}/issues/{number}"
+                    )
+                    # REST defaults to 30 comments per page; page through
+                    # at 100 so the detail view is as complete as the gh
+                    # CLI fallback (which returns every comment).
+                    comments: list = []
+                    page = 1
+                    while True:
+                        batch = api.request(
+                            "GET",
+                            f"/repos/{repo}/issues/{number}/comments"
+                            f"?per_page=100&page={page}",
+                        )
+                        comments.extend(batch or [])
+                        if not batch or len(batch) < 100:
+                            break
+                        page += 1
+                except gh_api.GhApiError as exc:
+                    self._send_error_json(502, f"GitHub API error: {exc.message}")
+                    return
+                except OSError:
+                    self._send_error_json(502, "GitHub API unreachable")
+                    return
+                # Match the gh CLI response shape the UI expects
+                self._send_json({
+                    "number": issue.get("number"),
+                    "title": issue.get("title", ""),
+                    "body": issue.get("body") or "",
+                    "state": issue.get("state", "").upper(),
+                    "labels": [
+                        {"name": l["name"]} for l in issue.get("labels", [])
                     ],
-                    capture_output=True, text=True, check=True, timeout=30,
-                )
-                data = json.loads(result.stdout)
+                    "comments": [
+                        {
+                            "createdAt": c.get("created_at", ""),
+                            "body": c.get("body", ""),
+                        }
+                        for c in (comments or [])
+                    ],
+                })
+                return
+            try:
+                with gh_slots:
+                    result = subprocess.run(
+                        [
+                            "gh", "issue", "view", str(number),
+                            "--repo", repo,
+                            "--json", "number,title,body,comments,labels,state",
+                        ],
+                        capture_output=True, text=True, check=True, timeout=30,
+                    )
+                data = _json_loads(result.stdout)
                 self._send_json(data)
             except subprocess.CalledProcessError as exc:
                 self._send_error_json(
@@ -201,14 +452,81 @@ def make_handler(triage_dir: Path, repo: str):
                 )
             except subprocess.TimeoutExpired:
                 self._send_error_json(504, "gh CLI timed out")
-            except json.JSONDecodeError:
+            except ValueError:
+                self._send_error_json(502, "Invalid JSON from gh CLI")
+
+        def _handle_get_issues_batch(self) -> None:
+            """Fetch details for several issues with one gh GraphQL call.
+
+            The dashboard prefetches many issues at once; a single aliased
+            GraphQL query avoids paying one subprocess fork + TLS handshake
+            per issue.
+            """
+            try:
+                body = _json_loads(self._read_body())
+            except ValueError:
+                self._send_error_json(400, "Invalid JSON body")
+                return
+
+            numbers = body.get("numbers")
+            if (
+                not isinstance(numbers, list)
+                or not numbers
+                or not all(isinstance(n, int) and n > 0 for n in numbers)
+            ):
+                self._send_error_json(
+                    400, "numbers must be a non-empty list of positive integers"
+                )
+                return
+
+            owner, name = repo.split("/", 1)
+            fields = (
+                "number title body state "
+                "labels(first: 20) { nodes { name } } "
+                "comments(first: 100) { nodes { createdAt body } }"
+            )
+            aliases = " ".join(
+                f"i{n}: issue(number: {n}) {{ {fields} }}" for n in numbers
+            )
+            query = (
+                f'query {{ repository(owner: "{owner}", name: "{name}") '
+                f"{{ {aliases} }} }}"
+            )
+            try:
+                if api is not None:
+                    repo_data = api.graphql(query).get("repository") or {}
+                else:
+                    with gh_slots:
+                        result = subprocess.run(
+                            ["gh", "api", "graphql", "-f", f"query={query}"],
+                            capture_output=True, text=True, check=True, timeout=30,
+                        )
+                    data = _json_loads(result.stdout)
+                    repo_data = data.get("data", {}).get("repository") or {}
+                issues = {
+                    str(n): repo_data[f"i{n}"]
+                    for n in numbers
+                    if repo_data.get(f"i{n}")
+                }
+                self._send_json(issues)
+            except gh_api.GhApiError as exc:
+                self._send_error_json(502, f"GitHub API error: {exc.message}")
+            except OSError:
+                self._send_error_json(502, "GitHub API unreachable")
+            except subprocess.CalledProcessError as exc:
+                self._send_error_json(
+                    502, f"gh CLI error: {exc.stderr.strip()}"
+                )
+            except subprocess.TimeoutExpired:
+                self._send_error_json(504, "gh CLI timed out")
+            except ValueError:
                 self._send_error_json(502, "Invalid JSON from gh CLI")
 
         def _handle_action(self) -> None:
             """Handle a triage action (close, comment, skip)."""
             try:
-                body = json.loads(self._read_body())
-            except (json.JSONDecodeError, UnicodeDecodeError):
+                body = _json_loads(self._read_body())
+            except ValueError:
                 self._send_error_json(400, "Invalid JSON body")
                 return
 
@@ -241,12 +559,16 @@ def make_handler(triage_dir: Path, repo: str):
             elif action == "skip":
                 self._do_skip(number, comment)
 
-        def _run_gh(self, args: list[str]) -> tuple[bool, str]:
+        def _run_gh(
+            self, args: list[str], input_text: str | None = None
+        ) -> tuple[bool, str]:
             """Run a gh CLI command. Returns (success, error_message)."""
             try:
-                subprocess.run(
-                    args, check=True, capture_output=True, text=True, timeout=30
-                )
+                with gh_slots:
+                    subprocess.run(
+                        args, check=True, capture_output=True, text=True,
+                        timeout=30, input=input_text,
+                    )
                 return True, ""
             except subprocess.CalledProcessError as exc:
                 msg = exc.stderr.strip() if exc.stderr else str(exc)
@@ -256,6 +578,51 @@ def make_handler(triage_dir: Path, repo: str):
                 print("gh command timed out", file=sys.stderr)
                 return False, "Command timed out"
 
+        @staticmethod
+        def _close_patch_body(reason: str) -> dict:
+            """Build the PATCH body that closes an issue.
+
+            Labels are deliberately absent: the PATCH ``labels`` field
+            *replaces* the issue's whole label set, so label adds go
+            through the additive ``POST .../labels`` endpoint instead —
+            anything labeled on GitHub since the last gather survives.
+            """
+            return {
+                "state": "closed",
+                "state_reason": reason.replace(" ", "_"),
+            }
+
+        def _do_close_api(
+            self, number: int, comment: str, reason: str, labels: list[str]
+        ) -> None:
+            """Close an issue with one PATCH (plus comment/label POSTs)."""
+            try:
+                if comment.strip():
+                    api.request(
+                        "POST", f"/repos/{repo}/issues/{number}/comments",
+                        {"body": comment},
+                    )
+                if labels:
+                    api.request(
+                        "POST", f"/repos/{repo}/issues/{number}/labels",
+                        {"labels": labels},
+                    )
+                api.request(
+                    "PATCH", f"/repos/{repo}/issues/{number}",
+                    self._close_patch_body(reason),
+                )
+            except gh_api.GhApiError as exc:
+                self._send_json(
+                    {"ok": False, "error": f"Failed to close issue: {exc.message}"},
+                    502,
+                )
+                return
+            entry = mark_triaged(
+                triage_dir, number, "closed",
+                comment_posted=bool(comment.strip()),
+            )
+            self._send_json({"ok": True, "action": "closed", "entry": entry})
+
         def _do_close(
             self,
             number: int,
@@ -263,45 +630,43 @@ def make_handler(triage_dir: Path, repo: str):
             reason: str = "completed",
             labels: list[str] | None = None,
         ) -> None:
-            # Add labels if requested
-            for label in labels or []:
+            if api is not None:
+                self._do_close_api(number, comment, reason, labels or [])
+                return
+
+            # Post comment if provided ("--body-file -" reads from stdin,
+            # so no temp file round-trip is needed)
+            if comment.strip():
                 ok, err = self._run_gh([
-                    "gh", "issue", "edit", str(number),
-                    "--repo", repo, "--add-label", label,
-                ])
+                    "gh", "issue", "comment", str(number),
+                    "--repo", repo, "--body-file", "-",
+                ], input_text=comment)
                 if not ok:
                     self._send_json(
-                        {"ok": False, "error": f"Failed to add label '{label}': {err}"},
+                        {"ok": False, "error": f"Failed to post comment: {err}"},
                         502,
                     )
                     return
 
-            # Post comment if provided
-            if comment.strip():
-                with tempfile.NamedTemporaryFile(
-                    mode="w", suffix=".md", delete=False
-                ) as f:
-                    f.write(comment)
-                    tmppath = f.name
-                try:
-                    ok, err = self._run_gh([
-                        "gh", "issue", "comment", str(number),
-                        "--repo", repo, "--body-file", tmppath,
-                    ])
-                finally:
-                    os.unlink(tmppath)
+            # Label adds go through the additive labels endpoint in one
+            # call (the per-label "gh issue edit" spawned one process
+            # each); the close + reason follow in one PATCH.
+            if labels:
+                ok, err = self._run_gh([
+                    "gh", "api", "-X", "POST",
+                    f"repos/{repo}/issues/{number}/labels", "--input", "-",
+                ], input_text=_json_dumps({"labels": labels}).decode())
                 if not ok:
                     self._send_json(
-                        {"ok": False, "error": f"Failed to post comment: {err}"},
+                        {"ok": False, "error": f"Failed to add labels: {err}"},
                         502,
                     )
                     return
 
-            # Close the issue
             ok, err = self._run_gh([
-                "gh", "issue", "close", str(number),
-                "--repo", repo, "--reason", reason,
-            ])
+                "gh", "api", "-X", "PATCH",
+                f"repos/{repo}/issues/{number}", "--input", "-",
+            ], input_text=_json_dumps(self._close_patch_body(reason)).decode())
             if not ok:
                 self._send_json(
                     {"ok": False, "error": f"Failed to close issue: {err}"},
@@ -320,18 +685,30 @@ def make_handler(triage_dir: Path, repo: str):
                 self._send_error_json(400, "Comment cannot be empty")
                 return
 
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".md", delete=False
-            ) as f:
-                f.write(comment)
-                tmppath = f.name
-            try:
-                ok, err = self._run_gh([
-                    "gh", "issue", "comment", str(number),
-                    "--repo", repo, "--body-file", tmppath,
-                ])
-            finally:
-                os.unlink(tmppath)
+            if api is not None:
+                try:
+                    api.request(
+                        "POST", f"/repos/{repo}/issues/{number}/comments",
+                        {"body": comment},
+                    )
+                except gh_api.GhApiError as exc:
+                    self._send_json(
+                        {"ok": False, "error": f"Failed to post comment: {exc.message}"},
+                        502,
+                    )
+                    return
+                entry = mark_triaged(
+                    triage_dir, number, "commented", comment_posted=True,
+                )
+                self._send_json(
+                    {"ok": True, "action": "commented", "entry": entry}
+                )
+                return
+
+            ok, err = self._run_gh([
+                "gh", "issue", "comment", str(number),
+                "--repo", repo, "--body-file", "-",
+            ], input_text=comment)
 
             if not ok:
                 self._send_json(
@@ -351,6 +728,18 @@ def make_handler(triage_dir: Path, repo: str):
             entry = mark_triaged(triage_dir, number, "skipped", note=note)
             self._send_json({"ok": True, "action": "skipped", "entry": entry})
 
+        # -- Route tables (bound once at class-creation time) -----------------
+
+        _GET_ROUTES = {
+            "/": lambda self: self._serve_static("index.html"),
+            "/api/findings": _handle_get_findings,
+            "/api/state": _handle_get_state,
+        }
+        _POST_ROUTES = {
+            "/api/action": _handle_action,
+            "/api/issues/batch": _handle_get_issues_batch,
+        }
+
     return Handler
 
 
@@ -358,6 +747,31 @@ def make_handler(triage_dir: Path, repo: str):
 # Main
 # ---------------------------------------------------------------------------
 
+class BoundedThreadingHTTPServer(http.server.ThreadingHTTPServer):
+    """ThreadingHTTPServer with a ceiling on concurrently served requests.
+
+    The stock server spawns one thread per connection with no limit; a
+    burst of UI polls stacked on 30s gh timeouts could pile up active
+    handlers without bound. A semaphore caps them — excess connections
+    park on the semaphore in their (cheap, idle) thread until a slot
+    frees, keeping the accept loop itself unblocked.
+    """
+
+    max_handlers = 32
+
+    def __init__(self, *args, **kwargs):
+        self._handler_slots = threading.BoundedSemaphore(self.max_handlers)
+        super().__init__(*args, **kwargs)
+
+    def process_request_thread(self, request, client_address):
+        # Acquire the slot here, on the worker thread: keep-alive means a
+        # handler thread lives as long as its connection, and blocking the
+        # serve_forever() accept loop on a slot would also wedge shutdown()
+        # once max_handlers connections sit idle.
+        with self._handler_slots:
+            super().process_request_thread(request, client_address)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Issue triage web UI server")
     parser.add_argument(
@@ -392,11 +806,18 @@ def main() -> None:
         )
         sys.exit(1)
 
-    handler_cls = make_handler(triage_dir, repo)
-    server = http.server.ThreadingHTTPServer(("0.0.0.0", args.port), handler_cls)
+    # One token fetch at startup buys a persistent API connection for the
+    # whole session; without a token every call falls back to the gh CLI.
+    token = gh_api.get_token()
+    api = gh_api.GhApiClient(token) if token else None
+
+    handler_cls = make_handler(triage_dir, repo, api=api)
+    server = BoundedThreadingHTTPServer(("0.0.0.0", args.port), handler_cls)
 
     def shutdown(signum, frame):
         print("\nShutting down...")
+        if api is not None:
+            api.close()
         # Call shutdown() in a thread to avoid deadlock — the signal handler
         # runs on the main thread which is blocked in serve_forever().
         threading.Thread(target=server.shutdown, daemon=True).start()
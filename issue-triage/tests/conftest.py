@@ -13,8 +13,6 @@ import pytest
 
 # Make the skill modules importable
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-# Make test helpers importable
-sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 
 # ---------------------------------------------------------------------------
@@ -141,17 +139,35 @@ def empty_state() -> dict:
     return {}
 
 
-@pytest.fixture()
-def triage_dir(tmp_path: Path, sample_issues, sample_findings, sample_state) -> Path:
-    """On-disk triage directory populated with all 3 JSON files."""
-    d = tmp_path / "triage"
+@pytest.fixture(scope="session")
+def triage_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """On-disk triage directory shared by the whole session.
+
+    The autouse _reset_triage_files fixture rewrites the three JSON
+    files before every test, so tests stay isolated while the servers
+    bound to this directory live for the whole session.
+    """
+    d = tmp_path_factory.mktemp("triage-data") / "triage"
     d.mkdir()
-    (d / "issues.json").write_text(
+    return d
+
+
+@pytest.fixture(autouse=True)
+def _reset_triage_files(
+    triage_dir: Path, sample_issues, sample_findings, sample_state
+) -> None:
+    """Restore pristine issues/findings/state files before each test.
+
+    Files are unlinked first so the rewrite lands on a fresh inode and
+    the server's stat-keyed JSON cache cannot serve stale data.
+    """
+    for name in ("issues.json", "findings.json", "state.json"):
+        (triage_dir / name).unlink(missing_ok=True)
+    (triage_dir / "issues.json").write_text(
         json.dumps({"repo": "owner/repo", "issues": sample_issues})
     )
-    (d / "findings.json").write_text(json.dumps(sample_findings))
-    (d / "state.json").write_text(json.dumps(sample_state))
-    return d
+    (triage_dir / "findings.json").write_text(json.dumps(sample_findings))
+    (triage_dir / "state.json").write_text(json.dumps(sample_state))
 
 
 @pytest.fixture()
@@ -162,33 +178,52 @@ def empty_triage_dir(tmp_path: Path) -> Path:
     return d
 
 
-@pytest.fixture()
-def test_server(triage_dir: Path):
-    """Start an ephemeral HTTP server on port 0, yield ``(host, port)``."""
+def _start_server(triage_dir: Path):
     from server import make_handler
 
     handler_cls = make_handler(triage_dir, "owner/repo")
     srv = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler_cls)
-    host, port = srv.server_address
     t = threading.Thread(target=srv.serve_forever, daemon=True)
     t.start()
-    yield host, port
+    return srv
+
+
+@pytest.fixture(scope="session")
+def _session_server(triage_dir: Path):
+    """One ephemeral HTTP server for the whole session.
+
+    Binding and tearing down a server per test dominated the HTTP
+    tests' wall time; state isolation comes from _reset_triage_files.
+    """
+    srv = _start_server(triage_dir)
+    yield srv.server_address
     srv.shutdown()
 
 
 @pytest.fixture()
-def mocked_gh_server(triage_dir: Path):
-    """HTTP server with ``subprocess.run`` patched (no real ``gh`` calls)."""
-    from server import make_handler
+def test_server(_session_server):
+    """Session-shared HTTP server, yields ``(host, port)``."""
+    return _session_server
 
-    handler_cls = make_handler(triage_dir, "owner/repo")
-    srv = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler_cls)
-    host, port = srv.server_address
-    t = threading.Thread(target=srv.serve_forever, daemon=True)
-    t.start()
 
+@pytest.fixture(scope="session")
+def _session_mocked_gh_server(triage_dir: Path):
+    """Session-scoped server for the gh-action tests (no patching here)."""
+    srv = _start_server(triage_dir)
+    yield srv.server_address
+    srv.shutdown()
+
+
+@pytest.fixture()
+def mocked_gh_server(_session_mocked_gh_server):
+    """HTTP server with ``subprocess.run`` patched (no real ``gh`` calls).
+
+    Only the server is session-scoped; the patch starts and stops per
+    test so unrelated tests never see the mock. The handler looks up
+    ``subprocess.run`` at call time, so a function-scoped patch covers
+    requests served by the long-lived server.
+    """
+    host, port = _session_mocked_gh_server
     with patch("subprocess.run") as mock_run:
         mock_run.return_value = None  # _run_gh ignores return value on success
         yield host, port, mock_run
-
-    srv.shutdown()
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import json
 import subprocess
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
+import gather
 from gather import (
     compute_last_comment_at,
     detect_repo,
@@ -17,6 +19,25 @@ from gather import (
 )
 
 
+@pytest.fixture(autouse=True)
+def mock_subproc_run(monkeypatch) -> MagicMock:
+    """One patched ``gather.subprocess.run`` per test.
+
+    A single monkeypatched MagicMock replaces the per-test
+    ``with patch(...)`` blocks; tests assign a SimpleNamespace result
+    (all subprocess.run callers only read ``.stdout``, so a two-field
+    struct is plenty) or set ``.side_effect`` directly. Autouse also
+    guarantees no test in this module can shell out for real.
+    """
+    m = MagicMock()
+    monkeypatch.setattr("gather.subprocess.run", m)
+    yield m
+    # detect_repo/get_head_sha memoize for the process lifetime; drop the
+    # caches so a value computed against this test's mock cannot leak.
+    detect_repo.cache_clear()
+    gather._head_sha = None
+
+
 # ---------------------------------------------------------------------------
 # compute_last_comment_at — pure function tests
 # ---------------------------------------------------------------------------
@@ -65,14 +86,14 @@ def test_transform_issues_full(raw_gh_issues: list[dict]) -> None:
     assert len(result) == 2
 
     first = result[0]
-    assert first["number"] == 101
-    assert first["title"] == "Bug: crash on startup"
-    assert first["state"] == "OPEN"
-    assert first["author"] == "alice"
-    assert first["comments_count"] == 2
-    assert first["last_comment_at"] == "2025-01-20T14:30:00Z"
-    assert first["labels"] == ["bug", "priority:high"]
-    assert first["url"] == "https://github.com/owner/repo/issues/101"
+    assert first.number == 101
+    assert first.title == "Bug: crash on startup"
+    assert first.state == "OPEN"
+    assert first.author == "alice"
+    assert first.comments_count == 2
+    assert first.last_comment_at == "2025-01-20T14:30:00Z"
+    assert first.labels == ["bug", "priority:high"]
+    assert first.url == "https://github.com/owner/repo/issues/101"
 
 
 @pytest.mark.ai_generated
@@ -88,9 +109,9 @@ def test_transform_issues_missing_fields() -> None:
     result = transform_issues(raw)
     assert len(result) == 1
     issue = result[0]
-    assert issue["body"] == ""
-    assert issue["labels"] == []
-    assert issue["author"] == "unknown"
+    assert issue.body == ""
+    assert issue.labels == []
+    assert issue.author == "unknown"
 
 
 @pytest.mark.ai_generated
@@ -104,7 +125,7 @@ def test_transform_issues_labels_extracted() -> None:
         }
     ]
     result = transform_issues(raw)
-    assert result[0]["labels"] == ["bug", "help wanted"]
+    assert result[0].labels == ["bug", "help wanted"]
 
 
 @pytest.mark.ai_generated
@@ -112,8 +133,8 @@ def test_transform_issues_no_comments() -> None:
     """Issue with no comments gets count=0 and last_comment_at=None."""
     raw = [{"number": 9, "title": "No comments", "comments": []}]
     result = transform_issues(raw)
-    assert result[0]["comments_count"] == 0
-    assert result[0]["last_comment_at"] is None
+    assert result[0].comments_count == 0
+    assert result[0].last_comment_at is None
 
 
 # ---------------------------------------------------------------------------
@@ -122,51 +143,40 @@ def test_transform_issues_no_comments() -> None:
 
 
 @pytest.mark.ai_generated
-def test_detect_repo_ssh() -> None:
+def test_detect_repo_ssh(mock_subproc_run: MagicMock) -> None:
     """SSH remote URL parsed correctly."""
-    mock_result = MagicMock()
-    mock_result.stdout = "git@github.com:owner/repo.git\n"
-    with patch("gather.subprocess.run", return_value=mock_result):
-        assert detect_repo() == "owner/repo"
+    mock_subproc_run.return_value = SimpleNamespace(stdout="git@github.com:owner/repo.git\n", returncode=0)
+    assert detect_repo() == "owner/repo"
 
 
 @pytest.mark.ai_generated
-def test_detect_repo_https() -> None:
+def test_detect_repo_https(mock_subproc_run: MagicMock) -> None:
     """HTTPS remote URL parsed correctly."""
-    mock_result = MagicMock()
-    mock_result.stdout = "https://github.com/owner/repo.git\n"
-    with patch("gather.subprocess.run", return_value=mock_result):
-        assert detect_repo() == "owner/repo"
+    mock_subproc_run.return_value = SimpleNamespace(stdout="https://github.com/owner/repo.git\n", returncode=0)
+    assert detect_repo() == "owner/repo"
 
 
 @pytest.mark.ai_generated
-def test_detect_repo_no_dotgit() -> None:
+def test_detect_repo_no_dotgit(mock_subproc_run: MagicMock) -> None:
     """URL without .git suffix still works."""
-    mock_result = MagicMock()
-    mock_result.stdout = "https://github.com/owner/repo\n"
-    with patch("gather.subprocess.run", return_value=mock_result):
-        assert detect_repo() == "owner/repo"
+    mock_subproc_run.return_value = SimpleNamespace(stdout="https://github.com/owner/repo\n", returncode=0)
+    assert detect_repo() == "owner/repo"
 
 
 @pytest.mark.ai_generated
-def test_detect_repo_unknown_host() -> None:
+def test_detect_repo_unknown_host(mock_subproc_run: MagicMock) -> None:
     """Non-GitHub URL raises ValueError."""
-    mock_result = MagicMock()
-    mock_result.stdout = "https://gitlab.com/owner/repo.git\n"
-    with patch("gather.subprocess.run", return_value=mock_result):
-        with pytest.raises(ValueError, match="Cannot parse repo"):
-            detect_repo()
+    mock_subproc_run.return_value = SimpleNamespace(stdout="https://gitlab.com/owner/repo.git\n", returncode=0)
+    with pytest.raises(ValueError, match="Cannot parse repo"):
+        detect_repo()
 
 
 @pytest.mark.ai_generated
-def test_detect_repo_subprocess_fails() -> None:
+def test_detect_repo_subprocess_fails(mock_subproc_run: MagicMock) -> None:
     """CalledProcessError propagates from subprocess."""
-    with patch(
-        "gather.subprocess.run",
-        side_effect=subprocess.CalledProcessError(1, "git"),
-    ):
-        with pytest.raises(subprocess.CalledProcessError):
-            detect_repo()
+    mock_subproc_run.side_effect = subprocess.CalledProcessError(1, "git")
+    with pytest.raises(subprocess.CalledProcessError):
+        detect_repo()
 
 
 # ---------------------------------------------------------------------------
@@ -175,43 +185,37 @@ def test_detect_repo_subprocess_fails() -> None:
 
 
 @pytest.mark.ai_generated
-def test_gather_from_gh_basic() -> None:
+def test_gather_from_gh_basic(mock_subproc_run: MagicMock) -> None:
     """Correct gh args assembled without --label."""
-    mock_result = MagicMock()
-    mock_result.stdout = "[]"
-    with patch("gather.subprocess.run", return_value=mock_result) as mock_run:
-        result = gather_from_gh("owner/repo", 50)
-        assert result == []
-        args = mock_run.call_args[0][0]
-        assert "--repo" in args
-        assert "owner/repo" in args
-        assert "--limit" in args
-        assert "50" in args
-        assert "--label" not in args
+    mock_subproc_run.return_value = SimpleNamespace(stdout="[]", returncode=0)
+    result = gather_from_gh("owner/repo", 50)
+    assert result == []
+    args = mock_subproc_run.call_args[0][0]
+    assert "--repo" in args
+    assert "owner/repo" in args
+    assert "--limit" in args
+    assert "50" in args
+    assert "--label" not in args
 
 
 @pytest.mark.ai_generated
-def test_gather_from_gh_with_label() -> None:
+def test_gather_from_gh_with_label(mock_subproc_run: MagicMock) -> None:
     """--label is appended when label argument is provided."""
-    mock_result = MagicMock()
-    mock_result.stdout = "[]"
-    with patch("gather.subprocess.run", return_value=mock_result) as mock_run:
-        gather_from_gh("owner/repo", 10, label="bug")
-        args = mock_run.call_args[0][0]
-        assert "--label" in args
-        idx = args.index("--label")
-        assert args[idx + 1] == "bug"
+    mock_subproc_run.return_value = SimpleNamespace(stdout="[]", returncode=0)
+    gather_from_gh("owner/repo", 10, label="bug")
+    args = mock_subproc_run.call_args[0][0]
+    assert "--label" in args
+    idx = args.index("--label")
+    assert args[idx + 1] == "bug"
 
 
 @pytest.mark.ai_generated
-def test_gather_from_gh_parses_json() -> None:
+def test_gather_from_gh_parses_json(mock_subproc_run: MagicMock) -> None:
     """JSON stdout is parsed to a list of dicts."""
-    mock_result = MagicMock()
-    mock_result.stdout = json.dumps([{"number": 1, "title": "Test"}])
-    with patch("gather.subprocess.run", return_value=mock_result):
-        result = gather_from_gh("owner/repo", 10)
-        assert len(result) == 1
-        assert result[0]["number"] == 1
+    mock_subproc_run.return_value = SimpleNamespace(stdout=json.dumps([{"number": 1, "title": "Test"}]), returncode=0)
+    result = gather_from_gh("owner/repo", 10)
+    assert len(result) == 1
+    assert result[0]["number"] == 1
 
 
 # ---------------------------------------------------------------------------
@@ -220,19 +224,14 @@ def test_gather_from_gh_parses_json() -> None:
 
 
 @pytest.mark.ai_generated
-def test_get_head_sha_success() -> None:
+def test_get_head_sha_success(mock_subproc_run: MagicMock) -> None:
     """Returns the stripped SHA from git rev-parse."""
-    mock_result = MagicMock()
-    mock_result.stdout = "abc1234def5678\n"
-    with patch("gather.subprocess.run", return_value=mock_result):
-        assert get_head_sha() == "abc1234def5678"
+    mock_subproc_run.return_value = SimpleNamespace(stdout="abc1234def5678\n", returncode=0)
+    assert get_head_sha() == "abc1234def5678"
 
 
 @pytest.mark.ai_generated
-def test_get_head_sha_failure() -> None:
+def test_get_head_sha_failure(mock_subproc_run: MagicMock) -> None:
     """Returns empty string when git rev-parse fails."""
-    with patch(
-        "gather.subprocess.run",
-        side_effect=subprocess.CalledProcessError(1, "git"),
-    ):
-        assert get_head_sha() == ""
+    mock_subproc_run.side_effect = subprocess.CalledProcessError(1, "git")
+    assert get_head_sha() == ""
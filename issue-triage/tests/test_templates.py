@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
-from unittest.mock import patch
+from datetime import datetime, timezone
 
 import pytest
 
@@ -23,8 +22,6 @@ from templates import (
     render_issue_detail,
 )
 
-from helpers import FrozenDatetime
-
 
 # ---------------------------------------------------------------------------
 # Utility helpers
@@ -91,33 +88,21 @@ def test_format_date_none() -> None:
 def test_days_ago_today() -> None:
     """Date matching 'now' returns 'today'."""
     now = datetime(2025, 6, 15, 12, 0, 0, tzinfo=timezone.utc)
-    FrozenDatetime.freeze(now)
-    with patch("templates.datetime", FrozenDatetime):
-        result = _days_ago("2025-06-15T10:00:00+00:00")
-    FrozenDatetime.freeze(None)
-    assert result == "today"
+    assert _days_ago("2025-06-15T10:00:00+00:00", now=now) == "today"
 
 
 @pytest.mark.ai_generated
 def test_days_ago_one_day() -> None:
     """One day ago uses singular form."""
     now = datetime(2025, 6, 16, 12, 0, 0, tzinfo=timezone.utc)
-    FrozenDatetime.freeze(now)
-    with patch("templates.datetime", FrozenDatetime):
-        result = _days_ago("2025-06-15T10:00:00+00:00")
-    FrozenDatetime.freeze(None)
-    assert result == "1 day"
+    assert _days_ago("2025-06-15T10:00:00+00:00", now=now) == "1 day"
 
 
 @pytest.mark.ai_generated
 def test_days_ago_multiple() -> None:
     """Multiple days uses plural form."""
     now = datetime(2025, 6, 20, 12, 0, 0, tzinfo=timezone.utc)
-    FrozenDatetime.freeze(now)
-    with patch("templates.datetime", FrozenDatetime):
-        result = _days_ago("2025-06-15T10:00:00+00:00")
-    FrozenDatetime.freeze(None)
-    assert result == "5 days"
+    assert _days_ago("2025-06-15T10:00:00+00:00", now=now) == "5 days"
 
 
 @pytest.mark.ai_generated
@@ -235,7 +220,7 @@ def test_base_layout_structure() -> None:
     assert "<title>Test Page" in html
     assert "Issue Triage" in html
     assert '<a href="/">Dashboard</a>' in html
-    assert "<style>" in html
+    assert '<link rel="stylesheet" href="/app.css">' in html
     assert "<p>content</p>" in html
 
 
@@ -243,7 +228,7 @@ def test_base_layout_structure() -> None:
 def test_base_layout_escapes_title() -> None:
     """HTML in title is escaped."""
     html = base_layout("<script>bad</script>", "content")
-    assert "<script>bad</script>" not in html.split("<style>")[0]
+    assert "<script>bad</script>" not in html
     assert "&lt;script&gt;" in html
 
 
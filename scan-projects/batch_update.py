@@ -1,12 +1,28 @@
 #!/usr/bin/env python3
 """Batch update summaries from a JSON input."""
 
-import csv
+import functools
 import json
+import os
 import sys
 from pathlib import Path
 
 
+@functools.cache
+def _default_tsv() -> str:
+    """Resolve the default projects.tsv path once per process.
+
+    Plain str paths skip the PurePath parsing that open()/os.path take
+    care of natively; fine for a script that never changes directory.
+    """
+    return os.path.join(os.getcwd(), "projects.tsv")
+
+
+def _sanitize(value: str) -> str:
+    """Strip TSV-breaking characters, mirroring scan.write_tsv."""
+    return str(value).replace("\t", " ").replace("\n", " ").replace("\r", " ")
+
+
 def batch_update_summaries(updates: dict, tsv_path: Path = None):
     """
     Batch update summaries.
@@ -18,39 +34,56 @@ def batch_update_summaries(updates: dict, tsv_path: Path = None):
     Returns:
         Tuple of (num_updated, num_not_found)
     """
-    if tsv_path is None:
-        tsv_path = Path.cwd() / "projects.tsv"
+    tsv_path = os.fspath(tsv_path) if tsv_path is not None else _default_tsv()
 
-    if not tsv_path.exists():
+    if not os.path.exists(tsv_path):
         print(f"Error: {tsv_path} not found", file=sys.stderr)
         return 0, 0
 
-    # Read all rows
-    rows = []
-    headers = None
+    # Stream rows straight to a temp file instead of buffering the whole
+    # table; os.replace swaps it in atomically, so a crash mid-write can
+    # never leave a truncated projects.tsv behind.
+    tmp_path = tsv_path + ".tmp"
     updated_count = 0
-    not_found = []
-
-    with open(tsv_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f, delimiter="\t")
-        headers = reader.fieldnames
-
-        for row in reader:
-            folder = row["folder"]
-            if folder in updates:
-                row["summary"] = updates[folder]
-                updated_count += 1
-            rows.append(row)
-
-    # Check for folders that weren't found
-    found_folders = {row["folder"] for row in rows}
-    not_found = [f for f in updates.keys() if f not in found_folders]
-
-    # Write back
-    with open(tsv_path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=headers, delimiter="\t")
-        writer.writeheader()
-        writer.writerows(rows)
+    seen = set()
+
+    # Plain split/join: scan.write_tsv strips tabs/newlines from every
+    # field, so the csv quote machinery (and a dict per row) buys nothing.
+    with open(tsv_path, "r", encoding="utf-8") as fin:
+        header_line = fin.readline()
+        header = header_line.rstrip("\n").split("\t")
+        folder_idx = header.index("folder")
+        summary_idx = header.index("summary")
+
+        # Cheap pre-scan: if no row matches, skip the rewrite entirely —
+        # no temp file, no O(file) write, no mtime churn.
+        for line in fin:
+            parts = line.rstrip("\n").split("\t")
+            if len(parts) > summary_idx and parts[folder_idx] in updates:
+                break
+        else:
+            return 0, len(updates)
+
+        fin.seek(0)
+        fin.readline()  # past the header again
+        with open(tmp_path, "w", encoding="utf-8") as fout:
+            fout.write(header_line)
+            for line in fin:
+                parts = line.rstrip("\n").split("\t")
+                if len(parts) > summary_idx and parts[folder_idx] in updates:
+                    folder = parts[folder_idx]
+                    parts[summary_idx] = _sanitize(updates[folder])
+                    updated_count += 1
+                    seen.add(folder)
+                    fout.write("\t".join(parts) + "\n")
+                else:
+                    # Untouched rows pass through byte-for-byte.
+                    fout.write(line)
+
+    os.replace(tmp_path, tsv_path)
+
+    # Folders that weren't found
+    not_found = [f for f in updates.keys() if f not in seen]
 
     return updated_count, len(not_found)
 
@@ -1,372 +1,461 @@
-#!/usr/bin/env python3
-"""Scan directories and files to generate projects.tsv summary."""
-
-import os
-import re
-import subprocess
-import sys
-from collections import Counter
-from pathlib import Path
-from typing import Optional
-
-
-def run_git(repo_path: Path, *args) -> Optional[str]:
-    """Run a git command in the given repository."""
-    try:
-        result = subprocess.run(
-            ["git", "-C", str(repo_path)] + list(args),
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()
-        return None
-    except (subprocess.TimeoutExpired, subprocess.SubprocessError):
-        return None
-
-
-def get_earliest_commit(repo_path: Path) -> str:
-    """Get the earliest commit date."""
-    output = run_git(repo_path, "log", "--reverse", "--format=%aI", "--all")
-    if output:
-        return output.split("\n")[0]
-    return "N/A"
-
-
-def get_latest_commit(repo_path: Path) -> str:
-    """Get the latest commit date from main/master branch."""
-    # Try different branch names
-    for ref in ["origin/HEAD", "origin/main", "origin/master", "main", "master", "HEAD"]:
-        output = run_git(repo_path, "log", "-1", "--format=%aI", ref)
-        if output:
-            return output
-    return "N/A"
-
-
-def get_remote_url(repo_path: Path) -> str:
-    """Get the git remote URL."""
-    output = run_git(repo_path, "remote", "get-url", "origin")
-    return output if output else "N/A"
-
-
-def get_primary_language(dir_path: Path) -> str:
-    """Determine primary language by counting file extensions."""
-    # Language mappings
-    lang_map = {
-        ".py": "Python",
-        ".js": "JavaScript",
-        ".ts": "TypeScript",
-        ".java": "Java",
-        ".cpp": "C++",
-        ".cc": "C++",
-        ".cxx": "C++",
-        ".c": "C",
-        ".h": "C/C++",
-        ".rs": "Rust",
-        ".go": "Go",
-        ".rb": "Ruby",
-        ".jl": "Julia",
-        ".r": "R",
-        ".R": "R",
-        ".m": "MATLAB",
-        ".swift": "Swift",
-        ".kt": "Kotlin",
-        ".scala": "Scala",
-        ".sh": "Shell",
-        ".bash": "Shell",
-        ".php": "PHP",
-        ".cs": "C#",
-        ".html": "HTML",
-        ".css": "CSS",
-        ".tex": "TeX",
-        ".yml": "YAML",
-        ".yaml": "YAML",
-        ".md": "Markdown",
-        ".org": "Org",
-        ".rst": "reStructuredText",
-        ".nix": "Nix",
-    }
-
-    # Exclude directories
-    exclude_dirs = {".git", "node_modules", "venv", ".venv", "__pycache__",
-                   ".tox", "dist", "build", ".eggs", ".npm", ".cache"}
-
-    ext_counter = Counter()
-
-    try:
-        for root, dirs, files in os.walk(dir_path):
-            # Remove excluded directories from dirs in-place
-            dirs[:] = [d for d in dirs if d not in exclude_dirs]
-
-            for file in files:
-                ext = os.path.splitext(file)[1].lower()
-                if ext in lang_map:
-                    ext_counter[ext] += 1
-    except (PermissionError, OSError):
-        pass
-
-    if ext_counter:
-        most_common_ext = ext_counter.most_common(1)[0][0]
-        return lang_map[most_common_ext]
-
-    return "Unknown"
-
-
-def get_file_language(file_path: Path) -> str:
-    """Determine language/type from file extension."""
-    ext_map = {
-        ".py": "Python", ".js": "JavaScript", ".ts": "TypeScript",
-        ".sh": "Shell", ".bash": "Shell",
-        ".md": "Markdown", ".org": "Org", ".rst": "reStructuredText",
-        ".txt": "Text", ".tex": "TeX",
-        ".yml": "YAML", ".yaml": "YAML", ".json": "JSON", ".toml": "TOML",
-        ".gpg": "GPG-encrypted", ".secrets": "Secrets",
-        ".env": "Environment", ".tar.gz": "Archive",
-        ".gz": "Archive", ".zip": "Archive",
-    }
-    name = file_path.name
-    # Check compound extensions first
-    for compound in [".tar.gz"]:
-        if name.endswith(compound):
-            return ext_map[compound]
-    ext = file_path.suffix.lower()
-    return ext_map.get(ext, "Unknown")
-
-
-def get_license(dir_path: Path) -> str:
-    """Find and parse LICENSE file."""
-    # Common license file patterns
-    license_patterns = ["LICENSE", "LICENSE.txt", "LICENSE.md", "COPYING",
-                       "COPYING.txt", "LICENSE-MIT", "LICENSE-APACHE"]
-
-    for pattern in license_patterns:
-        for case_variant in [pattern, pattern.lower(), pattern.upper()]:
-            license_file = dir_path / case_variant
-            if license_file.exists():
-                try:
-                    content = license_file.read_text(encoding="utf-8", errors="ignore")
-                    # Try to detect license type from content
-                    first_lines = content[:500].upper()
-
-                    if "MIT LICENSE" in first_lines or "MIT License" in content[:200]:
-                        return "MIT"
-                    elif "APACHE LICENSE" in first_lines:
-                        if "VERSION 2.0" in first_lines:
-                            return "Apache-2.0"
-                        return "Apache"
-                    elif "GNU GENERAL PUBLIC LICENSE" in first_lines:
-                        if "VERSION 3" in first_lines:
-                            return "GPL-3.0"
-                        elif "VERSION 2" in first_lines:
-                            return "GPL-2.0"
-                        return "GPL"
-                    elif "GNU LESSER GENERAL PUBLIC LICENSE" in first_lines:
-                        return "LGPL"
-                    elif "BSD" in first_lines:
-                        if "3-CLAUSE" in first_lines:
-                            return "BSD-3-Clause"
-                        elif "2-CLAUSE" in first_lines:
-                            return "BSD-2-Clause"
-                        return "BSD"
-                    elif "MOZILLA PUBLIC LICENSE" in first_lines:
-                        return "MPL"
-                    elif "CREATIVE COMMONS" in first_lines:
-                        return "CC"
-                    else:
-                        # Return filename if we can't determine type
-                        return os.path.basename(license_file)
-                except (OSError, UnicodeDecodeError):
-                    pass
-
-    return "N/A"
-
-
-def get_entry_type(entry_path: Path) -> str:
-    """Determine the type of a filesystem entry."""
-    if entry_path.is_file():
-        return "file"
-    if entry_path.is_dir():
-        if (entry_path / ".git").exists():
-            return "git"
-        return "dir"
-    return "other"
-
-
-def scan_git_repository(repo_path: Path) -> dict:
-    """Scan a git repository and return metadata."""
-    return {
-        "folder": repo_path.name,
-        "type": "git",
-        "summary": "NEEDS_ANALYSIS",
-        "language": get_primary_language(repo_path),
-        "license": get_license(repo_path),
-        "earliest_commit": get_earliest_commit(repo_path),
-        "latest_commit": get_latest_commit(repo_path),
-        "url": get_remote_url(repo_path),
-    }
-
-
-def scan_directory(dir_path: Path) -> dict:
-    """Scan a non-git directory and return metadata."""
-    return {
-        "folder": dir_path.name,
-        "type": "dir",
-        "summary": "NEEDS_ANALYSIS",
-        "language": get_primary_language(dir_path),
-        "license": get_license(dir_path),
-        "earliest_commit": "N/A",
-        "latest_commit": "N/A",
-        "url": "N/A",
-    }
-
-
-def scan_file(file_path: Path) -> dict:
-    """Scan a standalone file and return metadata."""
-    return {
-        "folder": file_path.name,
-        "type": "file",
-        "summary": "NEEDS_ANALYSIS",
-        "language": get_file_language(file_path),
-        "license": "N/A",
-        "earliest_commit": "N/A",
-        "latest_commit": "N/A",
-        "url": "N/A",
-    }
-
-
-def read_existing_tsv(tsv_path: Path) -> dict:
-    """Read existing projects.tsv and return dict of folder -> data."""
-    existing = {}
-    if not tsv_path.exists():
-        return existing
-
-    try:
-        with open(tsv_path, "r", encoding="utf-8") as f:
-            header = f.readline().strip().split("\t")
-            for line in f:
-                parts = line.strip().split("\t")
-                if len(parts) >= len(header):
-                    folder = parts[0]
-                    existing[folder] = dict(zip(header, parts))
-    except (OSError, UnicodeDecodeError) as e:
-        print(f"Warning: Could not read existing TSV: {e}", file=sys.stderr)
-
-    return existing
-
-
-def write_tsv(tsv_path: Path, projects: list):
-    """Write projects data to TSV file."""
-    headers = ["folder", "type", "summary", "language", "license",
-               "earliest_commit", "latest_commit", "url"]
-
-    with open(tsv_path, "w", encoding="utf-8") as f:
-        f.write("\t".join(headers) + "\n")
-        for proj in projects:
-            row = [proj.get(h, "N/A") for h in headers]
-            # Escape tabs and newlines in data
-            row = [str(val).replace("\t", " ").replace("\n", " ").replace("\r", " ") for val in row]
-            f.write("\t".join(row) + "\n")
-
-
-# Entries to skip (not useful to catalog)
-SKIP_PATTERNS = {".claude"}
-
-
-def main():
-    """Main scanning function."""
-    base_dir = Path.cwd()
-    tsv_path = base_dir / "projects.tsv"
-
-    # Read existing data
-    existing = read_existing_tsv(tsv_path)
-
-    # Scan all entries (dirs and files)
-    all_projects = []
-    new_count = 0
-    skip_count = 0
-    error_count = 0
-    errors = []
-
-    # Get all entries (directories + files), excluding hidden and the TSV itself
-    entries = sorted(
-        [e for e in base_dir.iterdir()
-         if e.name not in SKIP_PATTERNS
-         and not e.name.startswith(".")
-         and e.name != "projects.tsv"],
-        key=lambda x: x.name.lower()
-    )
-    total = len(entries)
-
-    print(f"Scanning {total} entries...")
-
-    for i, entry in enumerate(entries, 1):
-        entry_name = entry.name
-
-        print(f"[{i}/{total}] Processing {entry_name}...", end="")
-
-        # Skip if already exists
-        if entry_name in existing:
-            all_projects.append(existing[entry_name])
-            skip_count += 1
-            print(" (skipped)")
-            continue
-
-        try:
-            entry_type = get_entry_type(entry)
-            if entry_type == "git":
-                proj_data = scan_git_repository(entry)
-            elif entry_type == "dir":
-                proj_data = scan_directory(entry)
-            elif entry_type == "file":
-                proj_data = scan_file(entry)
-            else:
-                print(" (skipped - unknown type)")
-                continue
-
-            all_projects.append(proj_data)
-            new_count += 1
-            print(f" + ({entry_type}, {proj_data['language']})")
-        except Exception as e:
-            error_count += 1
-            errors.append((entry_name, str(e)))
-            print(f" x Error: {e}")
-            all_projects.append({
-                "folder": entry_name,
-                "type": "error",
-                "summary": f"Error during scan: {e}",
-                "language": "Unknown",
-                "license": "N/A",
-                "earliest_commit": "N/A",
-                "latest_commit": "N/A",
-                "url": "N/A",
-            })
-
-    # Sort by folder name
-    all_projects.sort(key=lambda x: x["folder"].lower())
-
-    # Write TSV
-    write_tsv(tsv_path, all_projects)
-
-    # Print summary
-    print("\n" + "=" * 60)
-    print(f"Scanned {total} entries")
-    print(f"- New: {new_count}")
-    print(f"- Skipped (existing): {skip_count}")
-    print(f"- Errors: {error_count}")
-
-    if errors:
-        print("\nErrors:")
-        for folder, error in errors:
-            print(f"  - {folder}: {error}")
-
-    # Count types
-    type_counts = Counter(p.get("type", "unknown") for p in all_projects)
-    print(f"\nBy type: {dict(type_counts)}")
-
-    print(f"\nUpdated projects.tsv with {len(all_projects)} entries")
-    print(f"\nYou can view the results with: vd projects.tsv")
-
-
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3
+"""Scan directories and files to generate projects.tsv summary."""
+
+import os
+import re
+import subprocess
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+
+def run_git(repo_path: Path, *args) -> Optional[str]:
+    """Run a git command in the given repository."""
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(repo_path)] + list(args),
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        if result.returncode == 0:
+            return result.stdout.strip()
+        return None
+    except (subprocess.TimeoutExpired, subprocess.SubprocessError):
+        return None
+
+
+def get_commit_range(repo_path: Path) -> tuple:
+    """Get (earliest, latest) commit dates from a single git log.
+
+    One reverse-ordered log over all refs yields both ends of the
+    history; the previous pair of helpers spawned up to seven git
+    processes per repo (one for earliest, up to six ref attempts for
+    latest) for the same answer.
+    """
+    output = run_git(repo_path, "log", "--reverse", "--format=%aI", "--all")
+    if output:
+        lines = output.split("\n")
+        return lines[0], lines[-1]
+    return "N/A", "N/A"
+
+
+def get_remote_url(repo_path: Path) -> str:
+    """Get the git remote URL."""
+    output = run_git(repo_path, "remote", "get-url", "origin")
+    return output if output else "N/A"
+
+
+# Language mappings (module-level so repeated scans share one dict)
+LANG_MAP = {
+        ".py": "Python",
+        ".js": "JavaScript",
+        ".ts": "TypeScript",
+        ".java": "Java",
+        ".cpp": "C++",
+        ".cc": "C++",
+        ".cxx": "C++",
+        ".c": "C",
+        ".h": "C/C++",
+        ".rs": "Rust",
+        ".go": "Go",
+        ".rb": "Ruby",
+        ".jl": "Julia",
+        ".r": "R",
+        ".R": "R",
+        ".m": "MATLAB",
+        ".swift": "Swift",
+        ".kt": "Kotlin",
+        ".scala": "Scala",
+        ".sh": "Shell",
+        ".bash": "Shell",
+        ".php": "PHP",
+        ".cs": "C#",
+        ".html": "HTML",
+        ".css": "CSS",
+        ".tex": "TeX",
+        ".yml": "YAML",
+        ".yaml": "YAML",
+        ".md": "Markdown",
+        ".org": "Org",
+        ".rst": "reStructuredText",
+        ".nix": "Nix",
+}
+
+# Exclude directories
+EXCLUDE_DIRS = {".git", "node_modules", "venv", ".venv", "__pycache__",
+                ".tox", "dist", "build", ".eggs", ".npm", ".cache"}
+
+
+def get_primary_language(dir_path: Path) -> str:
+    """Determine primary language by counting file extensions."""
+    lang_counter = Counter()
+
+    # Iterative scandir walk: os.walk builds three lists per directory
+    # and re-stats entries; scandir hands back d_type from the dirent,
+    # so classifying thousands of files needs no extra syscalls.
+    stack = [str(dir_path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if is_dir:
+                        if entry.name not in EXCLUDE_DIRS:
+                            stack.append(entry.path)
+                        continue
+                    name = entry.name
+                    # dot > 0 matches splitext: dotfiles have no extension
+                    dot = name.rfind(".")
+                    if dot > 0:
+                        # Most extensions are already lowercase; only pay
+                        # the .lower() allocation on a miss.
+                        ext = name[dot:]
+                        if ext not in LANG_MAP:
+                            ext = ext.lower()
+                            if ext not in LANG_MAP:
+                                continue
+                        # Tally by language name, not extension: ".R" and
+                        # ".r" must land in the same bucket even though
+                        # the fast path skips lowering ".R".
+                        lang_counter[LANG_MAP[ext]] += 1
+        except (PermissionError, OSError):
+            continue
+
+    if lang_counter:
+        return lang_counter.most_common(1)[0][0]
+
+    return "Unknown"
+
+
+def get_file_language(file_path: Path) -> str:
+    """Determine language/type from file extension."""
+    ext_map = {
+        ".py": "Python", ".js": "JavaScript", ".ts": "TypeScript",
+        ".sh": "Shell", ".bash": "Shell",
+        ".md": "Markdown", ".org": "Org", ".rst": "reStructuredText",
+        ".txt": "Text", ".tex": "TeX",
+        ".yml": "YAML", ".yaml": "YAML", ".json": "JSON", ".toml": "TOML",
+        ".gpg": "GPG-encrypted", ".secrets": "Secrets",
+        ".env": "Environment", ".tar.gz": "Archive",
+        ".gz": "Archive", ".zip": "Archive",
+    }
+    name = file_path.name
+    # Check compound extensions first
+    for compound in [".tar.gz"]:
+        if name.endswith(compound):
+            return ext_map[compound]
+    ext = file_path.suffix.lower()
+    return ext_map.get(ext, "Unknown")
+
+
+# One alternation finds every license marker in a single C-level pass;
+# the old in-cascade rescanned the header once per candidate string.
+# Priority mirrors the old elif order, not match position.
+_LICENSE_RE = re.compile(
+    r"(?P<mit>MIT LICENSE)"
+    r"|(?P<apache>APACHE LICENSE)"
+    r"|(?P<gpl>GNU GENERAL PUBLIC LICENSE)"
+    r"|(?P<lgpl>GNU LESSER GENERAL PUBLIC LICENSE)"
+    r"|(?P<bsd>BSD)"
+    r"|(?P<mpl>MOZILLA PUBLIC LICENSE)"
+    r"|(?P<cc>CREATIVE COMMONS)"
+)
+_LICENSE_PRIORITY = {
+    "mit": 0, "apache": 1, "gpl": 2, "lgpl": 3, "bsd": 4, "mpl": 5, "cc": 6,
+}
+
+
+def _detect_license(content: str) -> Optional[str]:
+    """Identify a license from the opening text, or None if unrecognized."""
+    first_lines = content[:500].upper()
+    best = None
+    best_rank = len(_LICENSE_PRIORITY)
+    for m in _LICENSE_RE.finditer(first_lines):
+        rank = _LICENSE_PRIORITY[m.lastgroup]
+        if rank < best_rank:
+            best, best_rank = m.lastgroup, rank
+            if rank == 0:
+                break
+    if best is None:
+        return None
+    if best == "mit":
+        return "MIT"
+    if best == "apache":
+        return "Apache-2.0" if "VERSION 2.0" in first_lines else "Apache"
+    if best == "gpl":
+        if "VERSION 3" in first_lines:
+            return "GPL-3.0"
+        if "VERSION 2" in first_lines:
+            return "GPL-2.0"
+        return "GPL"
+    if best == "lgpl":
+        return "LGPL"
+    if best == "bsd":
+        if "3-CLAUSE" in first_lines:
+            return "BSD-3-Clause"
+        if "2-CLAUSE" in first_lines:
+            return "BSD-2-Clause"
+        return "BSD"
+    return {"mpl": "MPL", "cc": "CC"}[best]
+
+
+# Common license file patterns, in priority order
+LICENSE_PATTERNS = ["LICENSE", "LICENSE.txt", "LICENSE.md", "COPYING",
+                    "COPYING.txt", "LICENSE-MIT", "LICENSE-APACHE"]
+
+
+def get_license(dir_path: Path) -> str:
+    """Find and parse LICENSE file."""
+    # One directory listing replaces up to 21 per-candidate stat calls
+    # (7 patterns x 3 case variants); priority still follows the
+    # pattern order, not listing order.
+    try:
+        with os.scandir(dir_path) as it:
+            names = {e.name for e in it if e.is_file()}
+    except OSError:
+        return "N/A"
+
+    for pattern in LICENSE_PATTERNS:
+        for case_variant in [pattern, pattern.lower(), pattern.upper()]:
+            if case_variant in names:
+                license_file = dir_path / case_variant
+                try:
+                    content = license_file.read_text(encoding="utf-8", errors="ignore")
+                    detected = _detect_license(content)
+                    if detected:
+                        return detected
+                    # Return filename if we can't determine type
+                    return os.path.basename(license_file)
+                except (OSError, UnicodeDecodeError):
+                    pass
+
+    return "N/A"
+
+
+def get_entry_type(entry_path: Path) -> str:
+    """Determine the type of a filesystem entry."""
+    if entry_path.is_file():
+        return "file"
+    if entry_path.is_dir():
+        if (entry_path / ".git").exists():
+            return "git"
+        return "dir"
+    return "other"
+
+
+def scan_git_repository(repo_path: Path) -> dict:
+    """Scan a git repository and return metadata."""
+    earliest, latest = get_commit_range(repo_path)
+    return {
+        "folder": repo_path.name,
+        "type": "git",
+        "summary": "NEEDS_ANALYSIS",
+        "language": get_primary_language(repo_path),
+        "license": get_license(repo_path),
+        "earliest_commit": earliest,
+        "latest_commit": latest,
+        "url": get_remote_url(repo_path),
+    }
+
+
+def scan_directory(dir_path: Path) -> dict:
+    """Scan a non-git directory and return metadata."""
+    return {
+        "folder": dir_path.name,
+        "type": "dir",
+        "summary": "NEEDS_ANALYSIS",
+        "language": get_primary_language(dir_path),
+        "license": get_license(dir_path),
+        "earliest_commit": "N/A",
+        "latest_commit": "N/A",
+        "url": "N/A",
+    }
+
+
+def scan_file(file_path: Path) -> dict:
+    """Scan a standalone file and return metadata."""
+    return {
+        "folder": file_path.name,
+        "type": "file",
+        "summary": "NEEDS_ANALYSIS",
+        "language": get_file_language(file_path),
+        "license": "N/A",
+        "earliest_commit": "N/A",
+        "latest_commit": "N/A",
+        "url": "N/A",
+    }
+
+
+def read_existing_tsv(tsv_path: Path) -> dict:
+    """Read existing projects.tsv and return dict of folder -> data."""
+    existing = {}
+    if not tsv_path.exists():
+        return existing
+
+    try:
+        with open(tsv_path, "r", encoding="utf-8") as f:
+            header = f.readline().strip().split("\t")
+            for line in f:
+                parts = line.strip().split("\t")
+                if len(parts) >= len(header):
+                    folder = parts[0]
+                    existing[folder] = dict(zip(header, parts))
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"Warning: Could not read existing TSV: {e}", file=sys.stderr)
+
+    return existing
+
+
+def write_tsv(tsv_path: Path, projects: list):
+    """Write projects data to TSV file."""
+    headers = ["folder", "type", "summary", "language", "license",
+               "earliest_commit", "latest_commit", "url"]
+
+    with open(tsv_path, "w", encoding="utf-8") as f:
+        f.write("\t".join(headers) + "\n")
+        for proj in projects:
+            row = [proj.get(h, "N/A") for h in headers]
+            # Escape tabs and newlines in data
+            row = [str(val).replace("\t", " ").replace("\n", " ").replace("\r", " ") for val in row]
+            f.write("\t".join(row) + "\n")
+
+
+# Entries to skip (not useful to catalog)
+SKIP_PATTERNS = {".claude"}
+
+
+def _scan_entry(entry: Path) -> Optional[dict]:
+    """Scan a single entry; runs in a worker process.
+
+    Returns None for unknown entry types; errors come back as an
+    "error" row rather than raising, since exceptions don't carry
+    useful tracebacks across the process pool anyway.
+    """
+    try:
+        entry_type = get_entry_type(entry)
+        if entry_type == "git":
+            return scan_git_repository(entry)
+        if entry_type == "dir":
+            return scan_directory(entry)
+        if entry_type == "file":
+            return scan_file(entry)
+        return None
+    except Exception as e:
+        return {
+            "folder": entry.name,
+            "type": "error",
+            "summary": f"Error during scan: {e}",
+            "language": "Unknown",
+            "license": "N/A",
+            "earliest_commit": "N/A",
+            "latest_commit": "N/A",
+            "url": "N/A",
+        }
+
+
+def main():
+    """Main scanning function."""
+    base_dir = Path.cwd()
+    tsv_path = base_dir / "projects.tsv"
+
+    # Read existing data
+    existing = read_existing_tsv(tsv_path)
+
+    # Scan all entries (dirs and files)
+    all_projects = []
+    new_count = 0
+    skip_count = 0
+    error_count = 0
+    errors = []
+
+    # Get all entries (directories + files), excluding hidden and the TSV itself
+    entries = sorted(
+        [e for e in base_dir.iterdir()
+         if e.name not in SKIP_PATTERNS
+         and not e.name.startswith(".")
+         and e.name != "projects.tsv"],
+        key=lambda x: x.name.lower()
+    )
+    total = len(entries)
+
+    print(f"Scanning {total} entries...")
+
+    # Keep already-cataloged entries as-is; only new ones need scanning.
+    to_scan = []
+    for entry in entries:
+        if entry.name in existing:
+            all_projects.append(existing[entry.name])
+            skip_count += 1
+        else:
+            to_scan.append(entry)
+
+    if skip_count:
+        print(f"Skipping {skip_count} already-cataloged entries")
+
+    # Per-entry prints are only worth their stdio cost on a terminal;
+    # when output is piped (logs, CI) a periodic stderr counter keeps
+    # the hot loop free of per-item write syscalls. Errors still land
+    # in the end-of-run summary either way.
+    total_new = len(to_scan)
+    interactive = sys.stdout.isatty()
+
+    # Each scan is dominated by git subprocesses and tree walks with no
+    # shared state, so fan the new entries out across worker processes.
+    # ex.map preserves input order, keeping the progress output stable.
+    with ProcessPoolExecutor() as ex:
+        for i, (entry, proj_data) in enumerate(
+            zip(to_scan, ex.map(_scan_entry, to_scan, chunksize=4)), 1
+        ):
+            if interactive:
+                print(f"[{i}/{total_new}] Processing {entry.name}...", end="")
+            elif i % 100 == 0 or i == total_new:
+                print(f"[{i}/{total_new}]", file=sys.stderr)
+            if proj_data is None:
+                if interactive:
+                    print(" (skipped - unknown type)")
+                continue
+            all_projects.append(proj_data)
+            if proj_data["type"] == "error":
+                error_count += 1
+                errors.append((entry.name, proj_data["summary"]))
+                if interactive:
+                    print(f" x {proj_data['summary']}")
+            else:
+                new_count += 1
+                if interactive:
+                    print(f" + ({proj_data['type']}, {proj_data['language']})")
+
+    # Sort by folder name
+    all_projects.sort(key=lambda x: x["folder"].lower())
+
+    # Write TSV
+    write_tsv(tsv_path, all_projects)
+
+    # Print summary
+    print("\n" + "=" * 60)
+    print(f"Scanned {total} entries")
+    print(f"- New: {new_count}")
+    print(f"- Skipped (existing): {skip_count}")
+    print(f"- Errors: {error_count}")
+
+    if errors:
+        print("\nErrors:")
+        for folder, error in errors:
+            print(f"  - {folder}: {error}")
+
+    # Count types
+    type_counts = Counter(p.get("type", "unknown") for p in all_projects)
+    print(f"\nBy type: {dict(type_counts)}")
+
+    print(f"\nUpdated projects.tsv with {len(all_projects)} entries")
+    print(f"\nYou can view the results with: vd projects.tsv")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,61 +1,79 @@
 #!/usr/bin/env python3
 """Update summary for a specific project in projects.tsv."""
 
-import csv
+import functools
+import os
 import sys
 from pathlib import Path
 
 
+@functools.cache
+def _default_tsv() -> str:
+    """Resolve the default projects.tsv path once per process.
+
+    Plain str paths skip the PurePath parsing that open()/os.path take
+    care of natively; fine for a script that never changes directory.
+    """
+    return os.path.join(os.getcwd(), "projects.tsv")
+
+
 def update_summary(folder_name: str, new_summary: str, tsv_path: Path = None):
     """Update the summary for a specific project."""
-    if tsv_path is None:
-        tsv_path = Path.cwd() / "projects.tsv"
+    tsv_path = os.fspath(tsv_path) if tsv_path is not None else _default_tsv()
 
-    if not tsv_path.exists():
+    if not os.path.exists(tsv_path):
         print(f"Error: {tsv_path} not found", file=sys.stderr)
         return False
 
-    # Read all rows
-    rows = []
-    headers = None
+    # Stream rows straight to a temp file instead of buffering the whole
+    # table; os.replace swaps it in atomically once the rewrite succeeds.
+    tmp_path = tsv_path + ".tmp"
     updated = False
 
-    with open(tsv_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f, delimiter="\t")
-        headers = reader.fieldnames
-
-        for row in reader:
-            if row["folder"] == folder_name:
-                row["summary"] = new_summary
+    # Plain split/join: scan.write_tsv strips tabs/newlines from every
+    # field, so the csv quote machinery (and a dict per row) buys nothing.
+    safe_summary = str(new_summary).replace("\t", " ").replace("\n", " ").replace("\r", " ")
+    with open(tsv_path, "r", encoding="utf-8") as fin, \
+            open(tmp_path, "w", encoding="utf-8") as fout:
+        header_line = fin.readline()
+        fout.write(header_line)
+        header = header_line.rstrip("\n").split("\t")
+        folder_idx = header.index("folder")
+        summary_idx = header.index("summary")
+
+        for line in fin:
+            parts = line.rstrip("\n").split("\t")
+            if len(parts) > summary_idx and parts[folder_idx] == folder_name:
+                parts[summary_idx] = safe_summary
                 updated = True
-            rows.append(row)
+                fout.write("\t".join(parts) + "\n")
+            else:
+                fout.write(line)
 
     if not updated:
+        os.remove(tmp_path)
         print(f"Warning: Project '{folder_name}' not found in TSV", file=sys.stderr)
         return False
 
-    # Write back
-    with open(tsv_path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=headers, delimiter="\t")
-        writer.writeheader()
-        writer.writerows(rows)
-
+    os.replace(tmp_path, tsv_path)
     return True
 
 
 def get_projects_needing_analysis(tsv_path: Path = None, limit: int = None):
     """Get list of projects that need summary analysis."""
-    if tsv_path is None:
-        tsv_path = Path.cwd() / "projects.tsv"
+    tsv_path = os.fspath(tsv_path) if tsv_path is not None else _default_tsv()
 
     projects = []
 
     with open(tsv_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f, delimiter="\t")
-
-        for row in reader:
-            if row["summary"] == "NEEDS_ANALYSIS":
-                projects.append(row["folder"])
+        header = f.readline().rstrip("\n").split("\t")
+        folder_idx = header.index("folder")
+        summary_idx = header.index("summary")
+
+        for line in f:
+            parts = line.rstrip("\n").split("\t")
+            if len(parts) > summary_idx and parts[summary_idx] == "NEEDS_ANALYSIS":
+                projects.append(parts[folder_idx])
                 if limit and len(projects) >= limit:
                     break
 